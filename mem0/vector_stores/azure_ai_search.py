@@ -1,6 +1,9 @@
 import json
 import logging
+import random
 import re
+import time
+from functools import lru_cache
 from typing import List, Optional
 
 from pydantic import BaseModel
@@ -11,6 +14,7 @@ from mem0.vector_stores.base import VectorStoreBase
 try:
     from azure.core.credentials import AzureKeyCredential
     from azure.core.exceptions import ResourceNotFoundError
+    from azure.core.pipeline.transport import HttpTransport, RequestsTransport
     from azure.identity import DefaultAzureCredential
     from azure.search.documents import SearchClient
     from azure.search.documents.indexes import SearchIndexClient
@@ -33,6 +37,47 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Azure AI Search accepts at most 1000 documents per indexing request.
+MAX_BATCH_SIZE = 1000
+# Per-document status codes that mark a transient failure: version conflict (409), throttled (429),
+# index temporarily unavailable (422) and service unavailable (503).
+RETRYABLE_STATUS_CODES = (409, 422, 429, 503)
+MAX_RETRIES = 5
+
+
+@lru_cache(maxsize=None)
+def _get_default_credential():
+    """Return a process-wide DefaultAzureCredential so all stores share its credential chain and token cache."""
+    return DefaultAzureCredential()
+
+
+class _SharedTransport(HttpTransport):
+    """
+    Per-client view of a transport shared by several clients.
+
+    Closing a client (directly or by leaving its context manager) must not close the session the
+    other clients still use, so close() is a no-op here; the owner closes the shared transport.
+    """
+
+    def __init__(self, transport):
+        self._transport = transport
+
+    def __enter__(self):
+        self._transport.open()
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def open(self):
+        self._transport.open()
+
+    def close(self):
+        pass
+
+    def send(self, request, **kwargs):
+        return self._transport.send(request, **kwargs)
+
 
 class OutputData(BaseModel):
     id: Optional[str]
@@ -41,6 +86,12 @@ class OutputData(BaseModel):
 
 
 class AzureAISearch(VectorStoreBase):
+    # Payload keys that are also stored as top-level filterable fields.
+    FILTER_FIELDS = ("user_id", "run_id", "agent_id")
+    # Fields read back into OutputData; everything else (notably the vector) is left on the server.
+    # Pass a list copy to the SDK: SearchClient.search ignores a select that is not a list.
+    RESULT_FIELDS = ("id", "payload")
+
     def __init__(
         self,
         service_name,
@@ -80,19 +131,24 @@ class AzureAISearch(VectorStoreBase):
 
         # If the API key is not provided or is a placeholder, use DefaultAzureCredential.
         if self.api_key is None or self.api_key == "" or self.api_key == "your-api-key":
-            credential = DefaultAzureCredential()
+            credential = _get_default_credential()
             self.api_key = None
         else:
             credential = AzureKeyCredential(self.api_key)
 
+        # Both clients talk to the same endpoint, so let them share one transport (and its connection pool).
+        # The store owns it and closes it in __del__; the clients only get non-closing views of it.
+        self._transport = RequestsTransport()
         self.search_client = SearchClient(
             endpoint=f"https://{service_name}.search.windows.net",
             index_name=self.index_name,
             credential=credential,
+            transport=_SharedTransport(self._transport),
         )
         self.index_client = SearchIndexClient(
             endpoint=f"https://{service_name}.search.windows.net",
             credential=credential,
+            transport=_SharedTransport(self._transport),
         )
 
         self.search_client._client._config.user_agent_policy.add_user_agent("mem0")
@@ -164,9 +220,7 @@ class AzureAISearch(VectorStoreBase):
     def _generate_document(self, vector, payload, id):
         document = {"id": id, "vector": vector, "payload": json.dumps(payload)}
         # Extract additional fields if they exist.
-        for field in ["user_id", "run_id", "agent_id"]:
-            if field in payload:
-                document[field] = payload[field]
+        document.update({field: payload[field] for field in self.FILTER_FIELDS if field in payload})
         return document
 
     # Note: Explicit "insert" calls may later be decoupled from memory management decisions.
@@ -183,12 +237,58 @@ class AzureAISearch(VectorStoreBase):
         documents = [
             self._generate_document(vector, payload, id) for id, vector, payload in zip(ids, vectors, payloads)
         ]
-        response = self.search_client.upload_documents(documents)
-        for doc in response:
-            if not hasattr(doc, "status_code") and doc.get("status_code") != 201:
-                raise Exception(f"Insert failed for document {doc.get('id')}: {doc}")
+        response = []
+        for start in range(0, len(documents), MAX_BATCH_SIZE):
+            batch = documents[start : start + MAX_BATCH_SIZE]
+            response.extend(self._index_with_retry("Insert", self.search_client.upload_documents, batch))
         return response
 
+    def _index_with_retry(self, action, operation, documents):
+        """
+        Run an indexing operation, resending documents that failed with a transient status code.
+
+        Whole-request throttling is already retried by the SDK pipeline, but documents rejected
+        individually inside a successful batch are not.
+
+        Args:
+            action (str): Name of the operation, used in log and error messages.
+            operation (Callable): SearchClient method taking a list of documents.
+            documents (List[Dict]): Documents to send.
+
+        Returns:
+            List[IndexingResult]: Results of the successfully indexed documents.
+        """
+        results = []
+        attempt = 0
+        while True:
+            retry_ids = set()
+            for result in operation(documents):
+                if result.succeeded:
+                    results.append(result)
+                elif result.status_code in RETRYABLE_STATUS_CODES and attempt < MAX_RETRIES:
+                    retry_ids.add(result.key)
+                else:
+                    raise Exception(f"{action} failed for document {result.key}: {result.error_message}")
+            if not retry_ids:
+                return results
+
+            documents = [document for document in documents if document["id"] in retry_ids]
+            delay = min(2**attempt, 30) * random.uniform(0.5, 1.0)
+            attempt += 1
+            logger.warning(
+                f"{action} throttled for {len(documents)} documents in index {self.index_name}, "
+                f"retrying in {delay:.1f}s (attempt {attempt}/{MAX_RETRIES})"
+            )
+            time.sleep(delay)
+
+    def _parse_payload(self, payload: str) -> dict:
+        # Payloads written by this class are plain JSON; only fall back to
+        # extract_json for values wrapped in a code block.
+        try:
+            return json.loads(payload)
+        except ValueError:
+            return json.loads(extract_json(payload))
+
     def _sanitize_key(self, key: str) -> str:
         return re.sub(r"[^\w]", "", key)
 
@@ -231,6 +331,7 @@ class AzureAISearch(VectorStoreBase):
                 top=limit,
                 vector_filter_mode=self.vector_filter_mode,
                 search_fields=["payload"],
+                select=list(self.RESULT_FIELDS),
             )
         else:
             search_results = self.search_client.search(
@@ -238,12 +339,13 @@ class AzureAISearch(VectorStoreBase):
                 filter=filter_expression,
                 top=limit,
                 vector_filter_mode=self.vector_filter_mode,
+                select=list(self.RESULT_FIELDS),
             )
 
         results = []
         for result in search_results:
-            payload = json.loads(extract_json(result["payload"]))
-            results.append(OutputData(id=result["id"], score=result["@search.score"], payload=payload))
+            payload = self._parse_payload(result["payload"])
+            results.append(OutputData.model_construct(id=result["id"], score=result["@search.score"], payload=payload))
         return results
 
     def delete(self, vector_id):
@@ -253,10 +355,7 @@ class AzureAISearch(VectorStoreBase):
         Args:
             vector_id (str): ID of the vector to delete.
         """
-        response = self.search_client.delete_documents(documents=[{"id": vector_id}])
-        for doc in response:
-            if not hasattr(doc, "status_code") and doc.get("status_code") != 200:
-                raise Exception(f"Delete failed for document {vector_id}: {doc}")
+        response = self._index_with_retry("Delete", self.search_client.delete_documents, [{"id": vector_id}])
         logger.info(f"Deleted document with ID '{vector_id}' from index '{self.index_name}'.")
         return response
 
@@ -275,12 +374,8 @@ class AzureAISearch(VectorStoreBase):
         if payload:
             json_payload = json.dumps(payload)
             document["payload"] = json_payload
-            for field in ["user_id", "run_id", "agent_id"]:
-                document[field] = payload.get(field)
-        response = self.search_client.merge_or_upload_documents(documents=[document])
-        for doc in response:
-            if not hasattr(doc, "status_code") and doc.get("status_code") != 200:
-                raise Exception(f"Update failed for document {vector_id}: {doc}")
+            document.update({field: payload.get(field) for field in self.FILTER_FIELDS})
+        response = self._index_with_retry("Update", self.search_client.merge_or_upload_documents, [document])
         return response
 
     def get(self, vector_id) -> OutputData:
@@ -294,11 +389,11 @@ class AzureAISearch(VectorStoreBase):
             OutputData: Retrieved vector.
         """
         try:
-            result = self.search_client.get_document(key=vector_id)
+            result = self.search_client.get_document(key=vector_id, selected_fields=list(self.RESULT_FIELDS))
         except ResourceNotFoundError:
             return None
-        payload = json.loads(extract_json(result["payload"]))
-        return OutputData(id=result["id"], score=None, payload=payload)
+        payload = self._parse_payload(result["payload"])
+        return OutputData.model_construct(id=result["id"], score=None, payload=payload)
 
     def list_cols(self) -> List[str]:
         """
@@ -342,54 +437,27 @@ class AzureAISearch(VectorStoreBase):
         if filters:
             filter_expression = self._build_filter_expression(filters)
 
-        search_results = self.search_client.search(search_text="*", filter=filter_expression, top=limit)
+        search_results = self.search_client.search(
+            search_text="*", filter=filter_expression, top=limit, select=list(self.RESULT_FIELDS)
+        )
         results = []
         for result in search_results:
-            payload = json.loads(extract_json(result["payload"]))
-            results.append(OutputData(id=result["id"], score=result["@search.score"], payload=payload))
+            payload = self._parse_payload(result["payload"])
+            results.append(OutputData.model_construct(id=result["id"], score=result["@search.score"], payload=payload))
         return [results]
 
     def __del__(self):
         """Close the search client when the object is deleted."""
         self.search_client.close()
         self.index_client.close()
+        self._transport.close()
 
     def reset(self):
         """Reset the index by deleting and recreating it."""
         logger.warning(f"Resetting index {self.index_name}...")
 
         try:
-            # Close the existing clients
-            self.search_client.close()
-            self.index_client.close()
-
-            # Delete the collection
             self.delete_col()
-
-            # If the API key is not provided or is a placeholder, use DefaultAzureCredential.
-            if self.api_key is None or self.api_key == "" or self.api_key == "your-api-key":
-                credential = DefaultAzureCredential()
-                self.api_key = None
-            else:
-                credential = AzureKeyCredential(self.api_key)
-
-            # Reinitialize the clients
-            service_endpoint = f"https://{self.service_name}.search.windows.net"
-            self.search_client = SearchClient(
-                endpoint=service_endpoint,
-                index_name=self.index_name,
-                credential=credential,
-            )
-            self.index_client = SearchIndexClient(
-                endpoint=service_endpoint,
-                credential=credential,
-            )
-
-            # Add user agent
-            self.search_client._client._config.user_agent_policy.add_user_agent("mem0")
-            self.index_client._client._config.user_agent_policy.add_user_agent("mem0")
-
-            # Create the collection
             self.create_col()
         except Exception as e:
             logger.error(f"Error resetting index {self.index_name}: {e}")
@@ -1,13 +1,30 @@
 import json
+import math
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+from azure.core.credentials import AzureKeyCredential
 from azure.core.exceptions import HttpResponseError
+from azure.core.pipeline.transport import HttpTransport
+from azure.search.documents import SearchClient
+from azure.search.documents.models import IndexingResult
 
 from mem0.configs.vector_stores.azure_ai_search import AzureAISearchConfig
 
 # Import the AzureAISearch class and related models
-from mem0.vector_stores.azure_ai_search import AzureAISearch
+from mem0.vector_stores.azure_ai_search import AzureAISearch, _get_default_credential
+
+
+def _indexing_result(key, succeeded=True, status_code=201, error_message=None):
+    return IndexingResult(key=key, succeeded=succeeded, status_code=status_code, error_message=error_message)
+
+
+@pytest.fixture(autouse=True)
+def clear_default_credential_cache():
+    # The shared DefaultAzureCredential is cached per process; keep patched mocks from leaking across tests.
+    _get_default_credential.cache_clear()
+    yield
+    _get_default_credential.cache_clear()
 
 
 # Fixture to patch SearchClient and SearchIndexClient and create an instance of AzureAISearch.
@@ -30,12 +47,12 @@ def mock_clients():
 
         # Stub required methods on search_client.
         mock_search_client.upload_documents = Mock()
-        mock_search_client.upload_documents.return_value = [{"status": True, "id": "doc1"}]
+        mock_search_client.upload_documents.return_value = [_indexing_result("doc1")]
         mock_search_client.search = Mock()
         mock_search_client.delete_documents = Mock()
-        mock_search_client.delete_documents.return_value = [{"status": True, "id": "doc1"}]
+        mock_search_client.delete_documents.return_value = [_indexing_result("doc1", status_code=200)]
         mock_search_client.merge_or_upload_documents = Mock()
-        mock_search_client.merge_or_upload_documents.return_value = [{"status": True, "id": "doc1"}]
+        mock_search_client.merge_or_upload_documents.return_value = [_indexing_result("doc1", status_code=200)]
         mock_search_client.get_document = Mock()
         mock_search_client.close = Mock()
 
@@ -165,6 +182,34 @@ def test_initialization(mock_clients):
     mock_index_client.create_or_update_index.assert_called_once()
 
 
+def test_initialization_shares_transport(mock_clients):
+    """Test that the search and index clients share a single HTTP transport."""
+    with (
+        patch("mem0.vector_stores.azure_ai_search.SearchClient") as MockSearchClient,
+        patch("mem0.vector_stores.azure_ai_search.SearchIndexClient") as MockIndexClient,
+    ):
+        MockIndexClient.return_value.list_index_names.return_value = ["test-index"]
+        instance = AzureAISearch(
+            service_name="test-service", collection_name="test-index", api_key="test-api-key", embedding_model_dims=768
+        )
+
+    search_transport = MockSearchClient.call_args.kwargs["transport"]
+    index_transport = MockIndexClient.call_args.kwargs["transport"]
+    assert search_transport._transport is instance._transport
+    assert index_transport._transport is instance._transport
+
+    # Closing one client's transport must leave the shared session usable by the other.
+    index_transport.open()
+    search_transport.close()
+    with search_transport:
+        pass
+    index_transport.open()
+    assert instance._transport.session is not None
+
+    instance.__del__()
+    assert instance._transport.session is None
+
+
 def test_initialization_with_compression_types(mock_clients):
     """Test initialization with different compression types."""
     mock_search_client, mock_index_client, _ = mock_clients
@@ -370,8 +415,7 @@ def test_insert_single(azure_ai_search_instance):
     payloads = [{"user_id": "user1", "run_id": "run1", "agent_id": "agent1"}]
     ids = ["doc1"]
 
-    # Fix: Include status_code: 201 in mock response
-    mock_search_client.upload_documents.return_value = [{"status": True, "id": "doc1", "status_code": 201}]
+    mock_search_client.upload_documents.return_value = [_indexing_result("doc1")]
 
     instance.insert(vectors, payloads, ids)
 
@@ -384,7 +428,7 @@ def test_insert_single(azure_ai_search_instance):
     assert len(documents) == 1
     assert documents[0]["id"] == "doc1"
     assert documents[0]["vector"] == [0.1, 0.2, 0.3]
-    assert documents[0]["payload"] == json.dumps(payloads[0])
+    assert json.loads(documents[0]["payload"]) == payloads[0]
     assert documents[0]["user_id"] == "user1"
     assert documents[0]["run_id"] == "run1"
     assert documents[0]["agent_id"] == "agent1"
@@ -400,10 +444,8 @@ def test_insert_multiple(azure_ai_search_instance):
     payloads = [{"user_id": f"user{i}", "content": f"Test content {i}"} for i in range(num_docs)]
     ids = [f"doc{i}" for i in range(num_docs)]
 
-    # Configure mock to return success for all documents (fix: add status_code 201)
-    mock_search_client.upload_documents.return_value = [
-        {"status": True, "id": id_val, "status_code": 201} for id_val in ids
-    ]
+    # Configure mock to return success for all documents
+    mock_search_client.upload_documents.return_value = [_indexing_result(id_val) for id_val in ids]
 
     # Insert the documents
     instance.insert(vectors, payloads, ids)
@@ -419,22 +461,42 @@ def test_insert_multiple(azure_ai_search_instance):
     # Check first document
     assert documents[0]["id"] == "doc0"
     assert documents[0]["vector"] == [0.0, 0.1, 0.2]
-    assert documents[0]["payload"] == json.dumps(payloads[0])
+    assert json.loads(documents[0]["payload"]) == payloads[0]
     assert documents[0]["user_id"] == "user0"
 
     # Check last document
     assert documents[2]["id"] == "doc2"
     assert documents[2]["vector"] == [0.2, 0.3, 0.4]
-    assert documents[2]["payload"] == json.dumps(payloads[2])
+    assert json.loads(documents[2]["payload"]) == payloads[2]
     assert documents[2]["user_id"] == "user2"
 
 
+def test_insert_splits_large_batches(azure_ai_search_instance):
+    """Test that inserts larger than the service batch limit are sent in several requests."""
+    instance, mock_search_client, _ = azure_ai_search_instance
+    mock_search_client.upload_documents.return_value = []
+
+    num_docs = 2500
+    vectors = [[0.1, 0.2, 0.3]] * num_docs
+    payloads = [{"user_id": "user1"}] * num_docs
+    ids = [f"doc{i}" for i in range(num_docs)]
+
+    instance.insert(vectors, payloads, ids)
+
+    batch_sizes = [len(call.args[0]) for call in mock_search_client.upload_documents.call_args_list]
+    assert batch_sizes == [1000, 1000, 500]
+    sent_ids = [doc["id"] for call in mock_search_client.upload_documents.call_args_list for doc in call.args[0]]
+    assert sent_ids == ids
+
+
 def test_insert_with_error(azure_ai_search_instance):
     """Test insert when Azure returns an error for one or more documents."""
     instance, mock_search_client, _ = azure_ai_search_instance
 
     # Configure mock to return an error for one document
-    mock_search_client.upload_documents.return_value = [{"status": False, "id": "doc1", "errorMessage": "Azure error"}]
+    mock_search_client.upload_documents.return_value = [
+        _indexing_result("doc1", succeeded=False, status_code=400, error_message="Azure error")
+    ]
 
     vectors = [[0.1, 0.2, 0.3]]
     payloads = [{"user_id": "user1"}]
@@ -448,8 +510,8 @@ def test_insert_with_error(azure_ai_search_instance):
 
     # Configure mock to return mixed success/failure for multiple documents
     mock_search_client.upload_documents.return_value = [
-        {"status": True, "id": "doc1"},  # This should not cause failure
-        {"status": False, "id": "doc2", "errorMessage": "Azure error"},
+        _indexing_result("doc1"),  # This should not cause failure
+        _indexing_result("doc2", succeeded=False, status_code=400, error_message="Azure error"),
     ]
 
     vectors = [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
@@ -465,6 +527,59 @@ def test_insert_with_error(azure_ai_search_instance):
     )
 
 
+def test_insert_retries_throttled_documents(azure_ai_search_instance):
+    """Test that documents rejected with a transient status are resent until they succeed."""
+    instance, mock_search_client, _ = azure_ai_search_instance
+    mock_search_client.upload_documents.side_effect = [
+        [_indexing_result("doc1"), _indexing_result("doc2", succeeded=False, status_code=429)],
+        [_indexing_result("doc2", succeeded=False, status_code=503)],
+        [_indexing_result("doc2", succeeded=False, status_code=409)],
+        [_indexing_result("doc2", succeeded=False, status_code=422)],
+        [_indexing_result("doc2")],
+    ]
+
+    with patch("mem0.vector_stores.azure_ai_search.time.sleep") as mock_sleep:
+        response = instance.insert([[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]], [{}, {}], ["doc1", "doc2"])
+
+    assert [result.key for result in response] == ["doc1", "doc2"]
+    assert mock_sleep.call_count == 4
+    # Only the throttled document is resent
+    resent = [[doc["id"] for doc in call.args[0]] for call in mock_search_client.upload_documents.call_args_list]
+    assert resent == [["doc1", "doc2"], ["doc2"], ["doc2"], ["doc2"], ["doc2"]]
+
+
+def test_insert_raises_when_retries_exhausted(azure_ai_search_instance):
+    """Test that insert fails instead of dropping documents that stay throttled."""
+    instance, mock_search_client, _ = azure_ai_search_instance
+    mock_search_client.upload_documents.return_value = [
+        _indexing_result("doc1", succeeded=False, status_code=429, error_message="Throttled")
+    ]
+
+    with patch("mem0.vector_stores.azure_ai_search.time.sleep") as mock_sleep:
+        with pytest.raises(Exception) as exc_info:
+            instance.insert([[0.1, 0.2, 0.3]], [{}], ["doc1"])
+
+    assert "Insert failed for document doc1: Throttled" in str(exc_info.value)
+    assert mock_sleep.call_count == 5
+    assert mock_search_client.upload_documents.call_count == 6
+
+
+def test_delete_and_update_raise_on_failure(azure_ai_search_instance):
+    """Test that delete and update surface per-document failures."""
+    instance, mock_search_client, _ = azure_ai_search_instance
+    mock_search_client.delete_documents.return_value = [
+        _indexing_result("doc1", succeeded=False, status_code=400, error_message="Bad request")
+    ]
+    mock_search_client.merge_or_upload_documents.return_value = [
+        _indexing_result("doc1", succeeded=False, status_code=400, error_message="Bad request")
+    ]
+
+    with pytest.raises(Exception, match="Delete failed for document doc1"):
+        instance.delete("doc1")
+    with pytest.raises(Exception, match="Update failed for document doc1"):
+        instance.update("doc1", payload={"data": "updated"})
+
+
 def test_insert_with_missing_payload_fields(azure_ai_search_instance):
     """Test inserting with payloads missing some of the expected fields."""
     instance, mock_search_client, _ = azure_ai_search_instance
@@ -473,9 +588,7 @@ def test_insert_with_missing_payload_fields(azure_ai_search_instance):
     ids = ["doc1"]
 
     # Mock successful response with a proper status_code
-    mock_search_client.upload_documents.return_value = [
-        {"id": "doc1", "status_code": 201}  # Simulating a successful response
-    ]
+    mock_search_client.upload_documents.return_value = [_indexing_result("doc1")]
 
     instance.insert(vectors, payloads, ids)
 
@@ -487,7 +600,7 @@ def test_insert_with_missing_payload_fields(azure_ai_search_instance):
     assert len(documents) == 1
     assert documents[0]["id"] == "doc1"
     assert documents[0]["vector"] == [0.1, 0.2, 0.3]
-    assert documents[0]["payload"] == json.dumps(payloads[0])
+    assert json.loads(documents[0]["payload"]) == payloads[0]
     assert "user_id" not in documents[0]
     assert "run_id" not in documents[0]
     assert "agent_id" not in documents[0]
@@ -547,6 +660,7 @@ def test_search_basic(azure_ai_search_instance):
     assert kwargs["filter"] is None  # No filters
     assert kwargs["top"] == 5
     assert kwargs["vector_filter_mode"] == "preFilter"  # Now correctly set
+    assert kwargs["select"] == ["id", "payload"]  # Vectors are not fetched back
 
     # Check results
     assert len(results) == 1
@@ -555,6 +669,99 @@ def test_search_basic(azure_ai_search_instance):
     assert results[0].payload == {"content": "Test content"}
 
 
+class _RequestSent(Exception):
+    pass
+
+
+class _CapturingTransport(HttpTransport):
+    """Transport that records each outgoing request and aborts it before it reaches the network."""
+
+    def __init__(self):
+        self.requests = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        raise _RequestSent()
+
+
+@pytest.mark.parametrize("hybrid_search", [False, True])
+def test_search_and_list_send_select(azure_ai_search_instance, hybrid_search):
+    """Test that the serialized search and list requests project only id and payload."""
+    instance, _, _ = azure_ai_search_instance
+    instance.hybrid_search = hybrid_search
+    transport = _CapturingTransport()
+    instance.search_client = SearchClient(
+        endpoint="https://test-service.search.windows.net",
+        index_name="test-index",
+        credential=AzureKeyCredential("test-api-key"),
+        transport=transport,
+    )
+
+    with pytest.raises(_RequestSent):
+        instance.search("test query", [0.1, 0.2, 0.3], limit=5)
+    with pytest.raises(_RequestSent):
+        instance.list(limit=10)
+
+    bodies = [json.loads(request.body) for request in transport.requests]
+    assert [body["select"] for body in bodies] == ["id,payload", "id,payload"]
+
+
+def test_get_parses_code_block_payload(azure_ai_search_instance):
+    """Test that payloads wrapped in a code block are still parsed."""
+    instance, mock_search_client, _ = azure_ai_search_instance
+    mock_search_client.get_document.return_value = {
+        "id": "doc1",
+        "payload": '```json\n{"content": "Test content"}\n```',
+    }
+
+    result = instance.get("doc1")
+
+    assert result.id == "doc1"
+    assert result.payload == {"content": "Test content"}
+
+
+def test_get_keeps_backticks_inside_json_payload(azure_ai_search_instance):
+    """Test that valid JSON payloads are parsed as-is, even when their values contain backticks."""
+    instance, mock_search_client, _ = azure_ai_search_instance
+    payload = {"data": "Prefers ```python``` fenced snippets"}
+    mock_search_client.get_document.return_value = {"id": "doc1", "payload": json.dumps(payload)}
+
+    result = instance.get("doc1")
+
+    assert result.payload == payload
+    mock_search_client.get_document.assert_called_once_with(key="doc1", selected_fields=["id", "payload"])
+
+
+def test_payload_round_trip_matches_stdlib_json(azure_ai_search_instance):
+    """Test that stored payloads read back exactly as the stdlib json module writes them."""
+    instance, mock_search_client, _ = azure_ai_search_instance
+    payload = {"user_id": "u", 1: "x", "big": 2**70, "small": -(2**63) - 1, "score": float("nan")}
+
+    document = instance._generate_document([0.1], payload, "doc1")
+    mock_search_client.get_document.return_value = {"id": "doc1", "payload": document["payload"]}
+    result = instance.get("doc1")
+
+    expected = json.loads(json.dumps(payload))
+    assert math.isnan(result.payload.pop("score"))
+    expected.pop("score")
+    assert result.payload == expected
+    assert result.payload["1"] == "x"
+    assert result.payload["big"] == 2**70 and isinstance(result.payload["big"], int)
+    assert result.payload["small"] == -(2**63) - 1 and isinstance(result.payload["small"], int)
+
+
 def test_init_with_valid_api_key(mock_clients):
     """Test __init__ with a valid API key and all required parameters."""
     mock_search_client, mock_index_client, mock_azure_key_credential = mock_clients
@@ -611,7 +818,6 @@ def test_init_with_default_api_key_triggers_default_credential(monkeypatch, mock
             api_key="",
             embedding_model_dims=64,
         )
-        assert mock_default_cred.call_count == 2
         # Test with api_key="your-api-key"
         AzureAISearch(
             service_name="test-service",
@@ -619,7 +825,9 @@ def test_init_with_default_api_key_triggers_default_credential(monkeypatch, mock
             api_key="your-api-key",
             embedding_model_dims=64,
         )
-        assert mock_default_cred.call_count == 3
+        # The credential is created once and shared by every instance
+        mock_default_cred.assert_called_once()
+        mock_azure_key_credential.assert_not_called()
 
 
 def test_init_sets_compression_type_to_none_if_unspecified(mock_clients):
@@ -664,3 +872,24 @@ def test_init_calls_create_col_if_collection_missing(mock_clients):
         embedding_model_dims=16,
     )
     mock_index_client.create_or_update_index.assert_called_once()
+
+
+def test_reset_reuses_clients(mock_clients):
+    """Test reset() drops and recreates the index without rebuilding the clients."""
+    mock_search_client, mock_index_client, _ = mock_clients
+    with patch("mem0.vector_stores.azure_ai_search.SearchClient") as MockSearchClient:
+        MockSearchClient.return_value = mock_search_client
+        instance = AzureAISearch(
+            service_name="test-service", collection_name="test-index", api_key="test-api-key", embedding_model_dims=16
+        )
+        mock_index_client.create_or_update_index.reset_mock()
+
+        instance.reset()
+
+        assert MockSearchClient.call_count == 1
+    mock_index_client.delete_index.assert_called_once_with("test-index")
+    mock_index_client.create_or_update_index.assert_called_once()
+    mock_search_client.close.assert_not_called()
+    mock_index_client.close.assert_not_called()
+    assert instance.search_client is mock_search_client
+    assert instance.index_client is mock_index_client